@@ -1,4 +1,5 @@
 from .activity import Activity
 from .dataset import Dataset
+from .preprocessing import Pipeline, LowPass, RemoveGravity, Magnitude
 
 from .utils import from_file
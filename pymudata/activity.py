@@ -1,9 +1,11 @@
-import pathlib
 import errno
 import os
 
+import numpy as np
 import pandas as pd
 
+from .preprocessing import Pipeline
+
 
 class Activity:
     """Activity class: high-level model of an activity CSV file
@@ -17,8 +19,25 @@ class Activity:
     ----------
     file_path : str
         The file path of the CSV containing the activity. Does not change.
+    values : numpy.ndarray
+        The raw `(n, channels)` float buffer with the numeric columns of the
+        activity. Does not change.
+    columns : list
+        The names of the numeric channels, in the same order as `values`
+        columns.
     dataframe : pandas.DataFrame
-        The `pandas` representation of the activity. Does not change.
+        The `pandas` representation of the activity, built from `values` the
+        first time it is accessed. Columns that are not float64 are taken from
+        their original arrays, so it matches the parsed file. Does not change.
+    processed_values : numpy.ndarray
+        The buffer obtained by running the pipeline on `values`, computed once
+        at acquisition (or when a new pipeline is set).
+    processed_columns : list
+        The names of the channels in `processed_values`.
+    processed_dataframe : pandas.DataFrame
+        The `pandas` representation of `processed_values`, built the first
+        time it is accessed. Non-numeric columns, and numeric columns left
+        unchanged by the pipeline, keep their original arrays and dtypes.
 
     Parameters
     ----------
@@ -30,22 +49,42 @@ class Activity:
         The list of deviations for each primitives
     ground_coordinates : list
         The list of cutting indices for the primitives
+    check_path : bool
+        Whether the existence of the file should be verified on creation. It
+        can be disabled when the caller already listed the file (as
+        `Dataset.synth` does), to avoid one `stat` per activity
+    pipeline : Pipeline
+        The preprocessing pipeline to apply to the data once acquired
 
     """
 
+    __slots__ = ('_file_path', '_values', '_columns', '_extra', '_order',
+                 '_dataframe',
+                 '_pipeline', '_processed_values', '_processed_columns',
+                 '_processed_dataframe', 'exercise_name', 'subject',
+                 '__ground_coordinates', '__primitive_deviations',
+                 '__pointwise_labels')
+
     def __init__(self, file_path: str,
                  exercise_name: str = None,
                  subject: int = None,
                  ground_coordinates: list = None,
                  primitive_deviations: list = None,
                  pointwise_labels: list = None,
-                 lazy: bool = True):
-        if not pathlib.Path(file_path).exists():
+                 lazy: bool = True,
+                 check_path: bool = True,
+                 pipeline: Pipeline = None):
+        if check_path and not os.path.exists(file_path):
             raise FileNotFoundError(
                 errno.ENOENT, os.strerror(errno.ENOENT), file_path)
 
         self._file_path = file_path
+        self._values = None
+        self._columns = None
+        self._extra = None
+        self._order = None
         self._dataframe = None
+        self.pipeline = pipeline
         self.exercise_name = exercise_name
         self.subject = subject
 
@@ -60,13 +99,60 @@ class Activity:
     def file_path(self):
         return self._file_path
 
+    @property
+    def values(self):
+        return self._values
+
+    @property
+    def columns(self):
+        return self._columns
+
     @property
     def dataframe(self):
+        if self._dataframe is None and self._values is not None:
+            self._dataframe = self._build_frame(self._values, self._columns)
+
         return self._dataframe
 
+    @property
+    def pipeline(self):
+        return self._pipeline
+
+    @property
+    def processed_values(self):
+        return self._processed_values
+
+    @property
+    def processed_columns(self):
+        return self._processed_columns
+
+    @property
+    def processed_dataframe(self):
+        if self._processed_dataframe is None and \
+           self._processed_values is not None:
+            self._processed_dataframe = self._build_frame(
+                self._processed_values, self._processed_columns)
+
+        return self._processed_dataframe
+
+    @pipeline.setter
+    def pipeline(self, pipeline: Pipeline):
+        self._pipeline = pipeline
+        self._processed_values = None
+        self._processed_columns = None
+        self._processed_dataframe = None
+
+        if pipeline is not None and self._values is not None:
+            self._processed_values, self._processed_columns = pipeline(
+                self._values, self._columns)
+
     @property
     def ground_pairs(self):
-        return self.__ground_pairs if self.__ground_coordinates else None
+        if not self.__ground_coordinates:
+            return None
+
+        return list(zip(self.__ground_coordinates[::2],
+                        self.__ground_coordinates[1::2]))
 
     @property
     def ground_coordinates(self):
@@ -96,28 +182,25 @@ class Activity:
 
         self.__ground_coordinates = ground_coordinates
 
-        if ground_coordinates:
-            self.__ground_pairs = list(zip(self.__ground_coordinates[::2],
-                                           self.__ground_coordinates[1::2]))
-
     @primitive_deviations.setter
     def primitive_deviations(self, primitive_deviations: list):
         if primitive_deviations and hasattr(
-                self, '_Activity__ground_pairs') and self.ground_pairs and len(
-                    primitive_deviations) != len(self.__ground_pairs):
+                self, '_Activity__ground_coordinates') and \
+                self.ground_pairs and \
+                len(primitive_deviations) != len(self.ground_pairs):
             raise Exception('Count mismatch between primitives and deviations')
 
         self.__primitive_deviations = primitive_deviations
 
     @pointwise_labels.setter
     def pointwise_labels(self, pointwise_labels):
-        if self._dataframe is None:
+        if self._values is None:
             self.__pointwise_labels = pointwise_labels
         elif pointwise_labels:
-            if self._dataframe.shape[0] != len(pointwise_labels):
+            if self._values.shape[0] != len(pointwise_labels):
                 msg = ('Count mismatch between points and labels '
                        '({} data points, {} labels passed)')
-                raise Exception(msg.format(self._dataframe.shape[0],
+                raise Exception(msg.format(self._values.shape[0],
                                            len(pointwise_labels)))
             else:
                 self.__pointwise_labels = pointwise_labels
@@ -132,7 +215,6 @@ class Activity:
         pairs, primitive deviations and pointwise labels.
         """
         self.__ground_coordinates = None
-        self.__ground_pairs = None
         self.__primitive_deviations = None
         self.__pointwise_labels = None
 
@@ -142,20 +224,98 @@ class Activity:
         This method will read in the data file corresponding to this activity.
         The user will be warned in case the data file is already acquired
         (either the Activity was created with laxy=False, or acquire was
-        already called).
+        already called). The numeric columns are stored in a single
+        contiguous float buffer. The original arrays of the columns that are
+        not float64 (labels, date strings, integers) are kept aside as well,
+        so that `dataframe` is identical to the parsed file. No DataFrame is
+        kept for the float columns until `dataframe` is accessed.
 
         """
-        if self._dataframe is not None:
+        if self._values is not None:
             print(f'Data file already acquired for {self.file_path}')
         else:
-            self._dataframe = pd.read_csv(self.file_path)
+            data = pd.read_csv(self.file_path)
+            numeric = data.select_dtypes('number')
+
+            self._columns = list(numeric.columns)
+            self._values = np.ascontiguousarray(numeric.to_numpy(dtype=float))
+            self._order = list(data.columns)
+
+            extra = [c for c in data.columns if data[c].dtype != np.float64]
+
+            if extra:
+                self._extra = data[extra]
+
+            if self._pipeline is not None:
+                self.pipeline = self._pipeline
+
+    def channel(self, name: str):
+        """Get the raw values of a single channel
+
+        This method returns a view over the activity buffer for the requested
+        channel, without building the DataFrame.
+
+        Parameters
+        ----------
+        name : str
+            The name of the channel, as found in the CSV header (for instance
+            gyro_x_knee)
+
+        """
+        if self._values is None:
+            raise Exception('Dataframe not loaded. Please run acquire()')
+
+        if name not in self._columns:
+            raise KeyError(f'Channel {name} not found in {self.file_path}')
+
+        return self._values[:, self._columns.index(name)]
+
+    def sensor(self, name: str):
+        """Get the acc/gyro triplets of a sensor
+
+        This method groups the x, y and z channels of each signal recorded by
+        a sensor into `(n, 3)` arrays. Channels are expected to follow the
+        `<signal>_<axis>_<sensor>` naming (for instance acc_x_knee). A
+        dictionary is returned, keyed by signal (acc, gyro), with only the
+        signals that are present for the sensor. When the three axes are
+        adjacent in the buffer the arrays are views, otherwise copies.
+
+        Parameters
+        ----------
+        name : str
+            The name of the sensor (for instance knee)
+
+        """
+        if self._values is None:
+            raise Exception('Dataframe not loaded. Please run acquire()')
+
+        triplets = {}
+
+        for signal in ('acc', 'gyro'):
+            names = [f'{signal}_{axis}_{name}' for axis in 'xyz']
+
+            if not all(n in self._columns for n in names):
+                continue
+
+            idx = [self._columns.index(n) for n in names]
+
+            if idx == list(range(idx[0], idx[0] + 3)):
+                triplets[signal] = self._values[:, idx[0]:idx[0] + 3]
+            else:
+                triplets[signal] = self._values[:, idx]
+
+        if not triplets:
+            raise KeyError(f'Sensor {name} not found in {self.file_path}')
+
+        return triplets
 
     def stream(self, window: int, stride: int):
         """Get a generator of sliding windows over the activity
 
         This method returns a generator of sliding windows for the activity,
         given a window size and a stride value (whatever is left from the
-        overlap).
+        overlap). When a pipeline is attached to the activity, the windows are
+        taken from the preprocessed data.
 
         Parameters
         ----------
@@ -165,16 +325,159 @@ class Activity:
             The value of stride betweeb consecutive windows
 
         """
-        if self.dataframe is None:
-            raise Exception('Dataframe not loaded. Please run acquire()')
-
+        frame = self._stream_frame()
         c_win = 0
 
-        while c_win + window <= self.dataframe.shape[0]:
+        while c_win + window <= frame.shape[0]:
             if self.pointwise_labels is not None:
                 lbs = self.__pointwise_labels[c_win:c_win + window]
             else:
                 lbs = None
 
-            yield self.dataframe.iloc[c_win:c_win + window], lbs
+            yield frame.iloc[c_win:c_win + window], lbs
             c_win += stride
+
+    def segment_windows(self, window: int, stride: int,
+                        min_overlap: float = None):
+        """Get the start indices of the windows aligned to the primitives
+
+        This method computes, without generating them, the windows that belong
+        to the primitives delimited by the ground pairs. Each segment is
+        considered as the half-open interval [start, end), clipped to the
+        length of the data. By default, windows are generated only within each
+        segment, starting from its first point. If `min_overlap` is given,
+        windows are instead taken over the whole series (as in `stream`) and
+        assigned to the segment they overlap the most, provided that the
+        overlap covers at least that fraction of the window. Windows that do
+        not satisfy the condition, or that do not overlap any segment, are not
+        returned. The candidate segments of each window are found by binary
+        search over the sorted pairs, so no windows-by-segments matrix is
+        built.
+
+        Two arrays are returned: the start index of each window, and the
+        position of its segment in `ground_pairs`.
+
+        Parameters
+        ----------
+        window : int
+            The size of the window to use during the slicing operation
+        stride : int
+            The value of stride between consecutive windows
+        min_overlap : float
+            The minimum fraction of the window that must fall within a segment
+
+        """
+        if self._values is None:
+            raise Exception('Dataframe not loaded. Please run acquire()')
+
+        if not self.ground_coordinates:
+            raise Exception(f'Ground coordinates not set on {self.file_path}')
+
+        if window < 1:
+            raise Exception(f'Invalid window size {window}')
+
+        if stride < 1:
+            raise Exception(f'Invalid stride {stride}')
+
+        if min_overlap is not None and not 0 < min_overlap <= 1:
+            raise Exception(f'Invalid overlap fraction {min_overlap}')
+
+        n = self._values.shape[0]
+        pairs = np.clip(np.array(self.ground_pairs, dtype=int), 0, n)
+        seg_start, seg_end = pairs[:, 0], pairs[:, 1]
+
+        if min_overlap is None:
+            counts = np.maximum(
+                (seg_end - seg_start - window) // stride + 1, 0)
+            segments = np.repeat(np.arange(len(pairs)), counts)
+            first = np.repeat(np.cumsum(counts) - counts, counts)
+            offsets = np.arange(counts.sum()) - first
+            starts = seg_start[segments] + offsets * stride
+
+            return starts, segments
+
+        order = np.argsort(seg_start, kind='stable')
+        seg_start, seg_end = seg_start[order], seg_end[order]
+
+        starts = np.arange(0, n - window + 1, stride)
+        first = np.searchsorted(np.maximum.accumulate(seg_end), starts,
+                                side='right')
+        last = np.searchsorted(seg_start, starts + window, side='left')
+
+        best = np.zeros(len(starts), dtype=int)
+        segments = np.zeros(len(starts), dtype=int)
+
+        for j in range(int((last - first).max(initial=0))):
+            k = np.minimum(first + j, len(order) - 1)
+            overlap = np.minimum(starts + window, seg_end[k]) - \
+                np.maximum(starts, seg_start[k])
+            better = (first + j < last) & (overlap > best)
+            best[better] = overlap[better]
+            segments[better] = k[better]
+
+        keep = (best > 0) & (best >= min_overlap * window)
+
+        return starts[keep], order[segments[keep]]
+
+    def stream_segments(self, window: int, stride: int,
+                        min_overlap: float = None):
+        """Get a generator of sliding windows aligned to the primitives
+
+        This method works as `stream`, but it only yields the windows returned
+        by `segment_windows`. Together with each window and its labels, the
+        deviation of the primitive the window belongs to is yielded (None if
+        no deviations are set).
+
+        Parameters
+        ----------
+        window : int
+            The size of the window to use during the slicing operation
+        stride : int
+            The value of stride between consecutive windows
+        min_overlap : float
+            The minimum fraction of the window that must fall within a segment
+
+        """
+        frame = self._stream_frame()
+        starts, segments = self.segment_windows(window, stride, min_overlap)
+
+        for c_win, seg in zip(starts.tolist(), segments.tolist()):
+            if self.pointwise_labels is not None:
+                lbs = self.__pointwise_labels[c_win:c_win + window]
+            else:
+                lbs = None
+
+            if self.primitive_deviations:
+                dev = self.primitive_deviations[seg]
+            else:
+                dev = None
+
+            yield frame.iloc[c_win:c_win + window], lbs, dev
+
+    def _build_frame(self, values: np.ndarray, columns: list):
+        frame = pd.DataFrame(values, columns=columns, copy=False)
+
+        if self._extra is None:
+            return frame
+
+        for c in self._extra:
+            if c not in self._columns:
+                frame[c] = self._extra[c]
+            elif c in columns and np.array_equal(
+                    values[:, columns.index(c)],
+                    self._values[:, self._columns.index(c)], equal_nan=True):
+                frame[c] = self._extra[c]
+
+        order = [c for c in self._order if c in frame] + \
+            [c for c in columns if c not in self._order]
+
+        return frame[order]
+
+    def _stream_frame(self):
+        if self._values is None:
+            raise Exception('Dataframe not loaded. Please run acquire()')
+
+        if self._pipeline is not None:
+            return self.processed_dataframe
+
+        return self.dataframe
@@ -1,16 +1,38 @@
 import ast
+import itertools
+import os
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Union
 
 import pandas as pd
 
 from .activity import Activity
+from .preprocessing import Pipeline
+from .validation import validate_activity
 
 
 Mask = Union[str, list]
 
 
+def _detach(activity: Activity):
+    """Copy the path and annotations of an activity, without data or pipeline
+
+    The copy is what gets sent to the validation workers, so that neither
+    buffers nor user-defined pipeline steps have to be pickled.
+
+    """
+    return Activity(activity.file_path,
+                    exercise_name=activity.exercise_name,
+                    subject=activity.subject,
+                    ground_coordinates=activity.ground_coordinates,
+                    primitive_deviations=activity.primitive_deviations,
+                    pointwise_labels=activity.pointwise_labels,
+                    check_path=False)
+
+
 class Dataset:
     """Dataset: smart collector of activities, grouped by exercise
 
@@ -32,11 +54,16 @@ class Dataset:
     the dataset will be created with 2 exercises only (exercise1 and exercise1)
     and the file othercontent.csv will be ignored.
 
+    A preprocessing pipeline can be passed to the dataset, and it will be
+    attached to all the activities created by `synth`.
+
     """
 
-    def __init__(self, data_location: str):
+    def __init__(self, data_location: str, pipeline: Pipeline = None):
         self.__data_location = data_location
-        self.__exercises = [x for x in Path(self.__data_location).glob('*/')
+        self.__pipeline = pipeline
+        self.__exercises = [Path(x.path)
+                            for x in os.scandir(self.__data_location)
                             if x.is_dir()]
         self.__masked = None
 
@@ -44,6 +71,10 @@ class Dataset:
     def data_location(self):
         return self.__data_location
 
+    @property
+    def pipeline(self):
+        return self.__pipeline
+
     @property
     def exercises(self):
         if self.__masked is None:
@@ -57,7 +88,8 @@ class Dataset:
 
         This method reads all the csv files in the dataset location, and then
         creates the cooresponding activities. It returns a list of activity
-        objects.
+        objects. Each exercise folder is listed only once, and the activities
+        are created without checking again for the existence of each file.
 
         Parameters
         ----------
@@ -65,12 +97,14 @@ class Dataset:
         self.__activities = {}
 
         for exercise in self.__exercises:
-            ff = Path(exercise).glob('*.csv')
             ex = exercise.name
-            self.__activities[ex] = []
 
-            for f in ff:
-                self.__activities[ex].append(Activity(f, exercise_name=ex))
+            with os.scandir(exercise) as entries:
+                self.__activities[ex] = [
+                    Activity(Path(f.path), exercise_name=ex, check_path=False,
+                             pipeline=self.__pipeline)
+                    for f in entries
+                    if f.name.endswith('.csv') and f.is_file()]
 
     def all_activities(self):
         """Get all activities in dataset
@@ -80,10 +114,48 @@ class Dataset:
 
         """
         if self.__masked is not None:
-            return sum(list(l for e, l in self.__activities.items()
-                            if e in self.__masked), [])
+            return list(itertools.chain.from_iterable(
+                l for e, l in self.__activities.items()
+                if e in self.__masked))
         else:
-            return sum(list(l for e, l in self.__activities.items()), [])
+            return list(itertools.chain.from_iterable(
+                self.__activities.values()))
+
+    def validate(self, workers: int = None, columns: list = None,
+                 full: bool = True):
+        """Check the integrity of all the activities in the dataset
+
+        This method validates the activities returned by `all_activities`,
+        checking that every file can be read, has the expected columns, and
+        that the annotations fit the number of data points. With `full`, the
+        files are also checked for missing values and monotonic timestamps.
+        The activities that are not acquired yet are validated in parallel
+        worker processes, while acquired ones are checked on their buffer in
+        the current process. The state of the activities is not modified. A
+        list of reports is returned, one per activity, in the same order as
+        `all_activities`.
+
+        Parameters
+        ----------
+        workers : int
+            The number of worker processes (the executor default if None)
+        columns : list
+            The columns each file is expected to have (not checked if None)
+        full : bool
+            Whether the content of the files should be parsed and checked
+
+        """
+        check = partial(validate_activity, columns=columns, full=full)
+        activities = self.all_activities()
+        pending = [a for a in activities if a.values is None]
+        chunk = max(1, len(pending) // (4 * (workers or os.cpu_count() or 1)))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = iter(list(executor.map(
+                check, map(_detach, pending), chunksize=chunk)))
+
+        return [next(reports) if a.values is None else check(a)
+                for a in activities]
 
     def mask_for_exercise(self, mask: Mask):
         """Apply a mask to the dataset to only retrieve one exercise
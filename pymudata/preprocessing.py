@@ -0,0 +1,153 @@
+import numpy as np
+
+
+def _moving_average(values: np.ndarray, window: int):
+    """Centered moving average over the rows of a 2D array
+
+    The average is computed for all the columns at once through cumulative
+    sums. At the edges of the series the window is shrunk to the available
+    points, so the output has the same shape as the input. Missing values are
+    left out of the sums and counted separately, so that a NaN only turns
+    into NaN the windows that contain it.
+
+    """
+    n = values.shape[0]
+    missing = np.isnan(values)
+
+    csum = np.zeros((n + 1, values.shape[1]))
+    np.cumsum(np.where(missing, 0, values), axis=0, out=csum[1:])
+    nsum = np.zeros((n + 1, values.shape[1]), dtype=int)
+    np.cumsum(missing, axis=0, out=nsum[1:])
+
+    start = np.arange(n) - window // 2
+    end = np.clip(start + window, 0, n)
+    start = np.clip(start, 0, n)
+
+    out = (csum[end] - csum[start]) / (end - start)[:, None]
+    out[nsum[end] - nsum[start] > 0] = np.nan
+
+    return out
+
+
+def _signal_columns(columns: list, signals: tuple):
+    return [i for i, c in enumerate(columns) if c.split('_')[0] in signals]
+
+
+class LowPass:
+    """Low-pass filter: moving average over the inertial channels
+
+    All the acc and gyro channels are smoothed with a centered moving average
+    of the given size. Other channels (timestamp) are left untouched.
+
+    Parameters
+    ----------
+    window : int
+        The number of points averaged for each output point
+
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise Exception(f'Invalid window size {window}')
+
+        self.window = window
+
+    def __call__(self, values: np.ndarray, columns: list):
+        idx = _signal_columns(columns, ('acc', 'gyro'))
+        out = values.copy()
+        out[:, idx] = _moving_average(values[:, idx], self.window)
+
+        return out, columns
+
+
+class RemoveGravity:
+    """Gravity removal: subtract the slow component of the accelerometers
+
+    Gravity is estimated on every acc channel with a wide moving average, and
+    then subtracted from the channel. Gyro and other channels are left
+    untouched.
+
+    Parameters
+    ----------
+    window : int
+        The number of points used to estimate the gravity component
+
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise Exception(f'Invalid window size {window}')
+
+        self.window = window
+
+    def __call__(self, values: np.ndarray, columns: list):
+        idx = _signal_columns(columns, ('acc',))
+        out = values.copy()
+        out[:, idx] -= _moving_average(values[:, idx], self.window)
+
+        return out, columns
+
+
+class Magnitude:
+    """Magnitude channels: norm of each acc/gyro triplet
+
+    For every `<signal>_x_<sensor>`, `<signal>_y_<sensor>` and
+    `<signal>_z_<sensor>` triplet a `<signal>_mag_<sensor>` channel is
+    appended, holding the euclidean norm of the three axes.
+
+    """
+
+    def __call__(self, values: np.ndarray, columns: list):
+        triplets = []
+        names = []
+
+        for c in columns:
+            signal, axis, sensor = (c.split('_', 2) + [None, None])[:3]
+
+            if signal not in ('acc', 'gyro') or axis != 'x':
+                continue
+
+            axes = [f'{signal}_{a}_{sensor}' for a in 'xyz']
+
+            if all(a in columns for a in axes):
+                triplets.append([columns.index(a) for a in axes])
+                names.append(f'{signal}_mag_{sensor}')
+
+        if not triplets:
+            return values, columns
+
+        mags = np.linalg.norm(values[:, triplets], axis=2)
+
+        return np.hstack([values, mags]), columns + names
+
+
+class Pipeline:
+    """Pipeline: ordered sequence of preprocessing steps
+
+    A pipeline can be attached to an activity (or to a dataset, that will
+    attach it to all its activities) to preprocess the data once, right after
+    acquisition. Each step is a callable that receives the `(n, channels)`
+    buffer and the list of column names, and returns both of them, without
+    modifying the input buffer. The output never shares memory with the
+    input, even when no step changes the data.
+
+    Parameters
+    ----------
+    steps : list
+        The preprocessing steps, applied in order
+
+    """
+
+    def __init__(self, steps: list = None):
+        self.steps = steps if steps is not None else []
+
+    def __call__(self, values: np.ndarray, columns: list):
+        raw = values
+
+        for step in self.steps:
+            values, columns = step(values, columns)
+
+        if np.shares_memory(values, raw):
+            return np.array(values, order='C'), list(columns)
+
+        return np.ascontiguousarray(values), list(columns)
@@ -0,0 +1,156 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+class ActivityReport:
+    """Activity report: outcome of the validation of an activity
+
+    Attributes
+    ----------
+    file_path : str
+        The file path of the CSV containing the activity
+    exercise_name : str
+        The name of the exercise performed in the activity
+    rows : int
+        The number of data points found in the file (None if unreadable)
+    issues : list
+        The description of every problem found, empty for valid activities
+
+    """
+
+    __slots__ = ('file_path', 'exercise_name', 'rows', 'issues')
+
+    def __init__(self, file_path: str, exercise_name: str = None):
+        self.file_path = file_path
+        self.exercise_name = exercise_name
+        self.rows = None
+        self.issues = []
+
+    @property
+    def valid(self):
+        return not self.issues
+
+
+_BLANK_RUN = re.compile(b'\n{2,}')
+
+
+def _count_rows(file_path: str, chunk_size: int = 1 << 20):
+    """Count the data lines of a CSV file without parsing it
+
+    The file is scanned in binary chunks, counting the lines that have at
+    least one non-whitespace byte: blank lines are not counted, as
+    `pandas.read_csv` skips them. Once the whitespace is dropped from a chunk,
+    blank lines are the runs of consecutive line breaks, so the count is done
+    with bytes operations only.
+
+    """
+    lines = 0
+    after_newline = True
+
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            chunk = chunk.translate(None, b' \t\r\x0b\x0c')
+
+            if not chunk:
+                continue
+
+            lines += chunk.count(b'\n') - chunk.endswith(b'\n')
+
+            if b'\n\n' in chunk:
+                lines -= sum(m.end() - m.start() - 1
+                             for m in _BLANK_RUN.finditer(chunk))
+
+            if after_newline and not chunk.startswith(b'\n'):
+                lines += 1
+
+            after_newline = chunk.endswith(b'\n')
+
+    return max(lines - 1, 0)
+
+
+def _read_header(file_path: str):
+    return list(pd.read_csv(file_path, nrows=0).columns)
+
+
+def validate_activity(activity, columns: list = None, full: bool = True):
+    """Check that an activity file is consistent with its annotations
+
+    The file is checked for the expected columns, and the annotations of the
+    activity are checked against the number of data points. When `full` is
+    set, the file is also parsed to check the numeric channels for missing
+    values and for monotonic timestamps; otherwise only the header is read,
+    and the rows are counted by scanning the file for non-blank lines, so
+    that both modes agree. Already acquired activities only have their header
+    read again.
+
+    Parameters
+    ----------
+    activity : Activity
+        The activity to validate
+    columns : list
+        The columns each file is expected to have (not checked if None)
+    full : bool
+        Whether the content of the file should be parsed and checked
+
+    """
+    report = ActivityReport(activity.file_path, activity.exercise_name)
+    values = None
+
+    try:
+        if activity.values is not None:
+            header = _read_header(activity.file_path)
+            numeric, values = activity.columns, activity.values
+        elif full:
+            data = pd.read_csv(activity.file_path)
+            header = list(data.columns)
+            data = data.select_dtypes('number')
+            numeric = list(data.columns)
+            values = data.to_numpy(dtype=float)
+        else:
+            header = _read_header(activity.file_path)
+            report.rows = _count_rows(activity.file_path)
+    except Exception as e:
+        report.issues.append(f'Unable to parse file: {e}')
+        return report
+
+    if values is not None:
+        report.rows = values.shape[0]
+
+    if columns is not None:
+        missing = [c for c in columns if c not in header]
+
+        if missing:
+            report.issues.append(f'Missing columns: {", ".join(missing)}')
+
+    if values is not None:
+        nans = np.isnan(values).sum(axis=0)
+
+        for c, n in zip(numeric, nans):
+            if n:
+                report.issues.append(f'{n} missing values in {c}')
+
+        if 'timestamp' in numeric:
+            ts = values[:, numeric.index('timestamp')]
+            steps = np.count_nonzero(np.diff(ts) < 0)
+
+            if steps:
+                report.issues.append(
+                    f'Timestamps not monotonic at {steps} points')
+
+    labels = activity.pointwise_labels
+
+    if labels and len(labels) != report.rows:
+        report.issues.append(
+            f'Count mismatch between points and labels ({report.rows} data '
+            f'points, {len(labels)} labels)')
+
+    coordinates = activity.ground_coordinates
+
+    if coordinates and (min(coordinates) < 0 or
+                        max(coordinates) > report.rows):
+        report.issues.append(
+            f'Ground coordinates out of range ({report.rows} data points)')
+
+    return report
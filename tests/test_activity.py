@@ -4,6 +4,7 @@ import sys
 from io import StringIO
 from contextlib import contextmanager
 
+import numpy as np
 import pandas as pd
 
 import pymudata
@@ -30,6 +31,8 @@ class TestActivity(unittest.TestCase):
         self.assertEqual(self.base_activity, act.file_path)
 
         self.assertIsNone(act.dataframe)
+        self.assertIsNone(act.values)
+        self.assertIsNone(act.columns)
         self.assertIsNone(act.ground_coordinates)
         self.assertIsNone(act.ground_pairs)
         self.assertIsNone(act.primitive_deviations)
@@ -66,6 +69,79 @@ class TestActivity(unittest.TestCase):
         act.acquire()
         self.assertIsInstance(act.dataframe, pd.DataFrame)
 
+    def test_acquire_values(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+
+        self.assertIsInstance(act.values, np.ndarray)
+        self.assertTupleEqual((7972, 7), act.values.shape)
+        self.assertTrue(act.values.flags['C_CONTIGUOUS'])
+        self.assertEqual('timestamp', act.columns[0])
+
+    def test_dataframe_shares_values(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+
+        self.assertListEqual(act.columns, list(act.dataframe.columns))
+        self.assertTrue(np.array_equal(act.values, act.dataframe.values))
+        self.assertIs(act.dataframe, act.dataframe)
+
+    def test_acquire_mixed_types(self):
+        act = pymudata.Activity('./tests/mixed.csv', lazy=False)
+
+        self.assertListEqual(['timestamp', 'acc_x_k', 'count'], act.columns)
+        self.assertTupleEqual((3, 3), act.values.shape)
+        self.assertListEqual([0.5, 0.7, 0.9], act.channel('acc_x_k').tolist())
+
+        with self.assertRaises(KeyError):
+            act.channel('label')
+
+        df = act.dataframe
+
+        self.assertListEqual(['timestamp', 'acc_x_k', 'count', 'label'],
+                             list(df.columns))
+        self.assertTrue(pd.api.types.is_integer_dtype(df['count']))
+        self.assertListEqual(['a', 'b', 'c'], list(df['label']))
+        self.assertTrue(df.equals(pd.read_csv('./tests/mixed.csv')))
+
+    def test_acquire_large_integers(self):
+        act = pymudata.Activity('./tests/large_int.csv', lazy=False)
+
+        self.assertListEqual([1600000000000000001, 1600000000000000002],
+                             act.dataframe['timestamp'].tolist())
+        self.assertTrue(
+            act.dataframe.equals(pd.read_csv('./tests/large_int.csv')))
+
+    def test_channel(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+        gyro = act.channel('gyro_x_knee')
+
+        self.assertTupleEqual((7972,), gyro.shape)
+        self.assertAlmostEqual(0.0771374836016354, gyro[0])
+
+        with self.assertRaises(KeyError):
+            act.channel('gyro_x_ankle')
+
+    def test_channel_unloaded(self):
+        act = pymudata.Activity(self.base_activity)
+
+        with self.assertRaises(Exception) as ex:
+            act.channel('gyro_x_knee')
+
+        self.assertIn('Dataframe not loaded.', str(ex.exception))
+
+    def test_sensor(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+        knee = act.sensor('knee')
+
+        self.assertListEqual(['acc', 'gyro'], sorted(knee.keys()))
+        self.assertTupleEqual((7972, 3), knee['acc'].shape)
+        self.assertTupleEqual((7972, 3), knee['gyro'].shape)
+        self.assertTrue(np.array_equal(act.channel('acc_z_knee'),
+                                       knee['acc'][:, 2]))
+        self.assertTrue(np.shares_memory(act.values, knee['gyro']))
+
+        with self.assertRaises(KeyError):
+            act.sensor('ankle')
+
     def test_double_acquire(self):
         act = pymudata.Activity(self.base_activity)
         act.acquire()
@@ -239,3 +315,124 @@ class TestActivity(unittest.TestCase):
             self.assertListEqual([1], l)
 
         self.assertEqual(7972, len(list(act.stream(1, 1))))
+
+    def test_activity_has_no_dict(self):
+        act = pymudata.Activity(self.base_activity)
+
+        with self.assertRaises(AttributeError):
+            act.__dict__
+
+        with self.assertRaises(AttributeError):
+            act.unknown_field = 10
+
+    def test_activity_skip_path_check(self):
+        act = pymudata.Activity('./nonexisting_file.csv', check_path=False)
+
+        self.assertEqual('./nonexisting_file.csv', act.file_path)
+
+    def test_segment_windows_within(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[10, 30, 40, 45, 50, 62],
+                                lazy=False)
+
+        starts, segments = act.segment_windows(5, 5)
+
+        self.assertListEqual([10, 15, 20, 25, 40, 50, 55],
+                             starts.tolist())
+        self.assertListEqual([0, 0, 0, 0, 1, 2, 2], segments.tolist())
+
+    def test_segment_windows_overlap(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[12, 30, 40, 45],
+                                lazy=False)
+
+        starts, segments = act.segment_windows(10, 5, min_overlap=0.5)
+
+        self.assertListEqual([10, 15, 20, 25, 35, 40], starts.tolist())
+        self.assertListEqual([0, 0, 0, 0, 1, 1], segments.tolist())
+
+    def test_segment_windows_overlap_disjoint(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[100, 120],
+                                primitive_deviations=[3],
+                                lazy=False)
+
+        starts, segments = act.segment_windows(10, 10, min_overlap=0.01)
+
+        self.assertListEqual([100, 110], starts.tolist())
+        self.assertListEqual([0, 0], segments.tolist())
+
+        devs = [d for _, _, d in act.stream_segments(10, 10, 0.01)]
+
+        self.assertListEqual([3, 3], devs)
+
+    def test_segment_windows_overlap_best_segment(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[22, 30, 0, 12, 13, 21],
+                                lazy=False)
+
+        starts, segments = act.segment_windows(10, 10, min_overlap=0.1)
+
+        self.assertListEqual([0, 10, 20], starts.tolist())
+        self.assertListEqual([1, 2, 0], segments.tolist())
+
+    def test_segment_windows_invalid_overlap(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[10, 30],
+                                lazy=False)
+
+        for overlap in (0, -0.5, 1.5):
+            with self.assertRaises(Exception) as ex:
+                act.segment_windows(10, 5, min_overlap=overlap)
+
+            self.assertIn('Invalid overlap fraction', str(ex.exception))
+
+    def test_segment_windows_invalid_sizes(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[10, 30],
+                                lazy=False)
+
+        with self.assertRaises(Exception) as ex:
+            act.segment_windows(10, 0)
+
+        self.assertIn('Invalid stride 0', str(ex.exception))
+
+        with self.assertRaises(Exception) as ex:
+            act.segment_windows(0, 5, min_overlap=0.5)
+
+        self.assertIn('Invalid window size 0', str(ex.exception))
+
+    def test_segment_windows_no_coordinates(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+
+        with self.assertRaises(Exception) as ex:
+            act.segment_windows(10, 5)
+
+        self.assertIn('Ground coordinates not set', str(ex.exception))
+
+    def test_stream_segments(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[10, 30, 40, 60],
+                                primitive_deviations=[0, 1],
+                                pointwise_labels=[1] * 7972,
+                                lazy=False)
+
+        windows = list(act.stream_segments(10, 10))
+
+        self.assertEqual(4, len(windows))
+        self.assertListEqual([0, 0, 1, 1], [d for _, _, d in windows])
+
+        for win, lbs, _ in windows:
+            self.assertEqual(10, win.shape[0])
+            self.assertListEqual([1] * 10, lbs)
+
+        self.assertTrue(windows[2][0].equals(act.dataframe.iloc[40:50]))
+
+    def test_stream_segments_no_deviations(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[10, 30],
+                                lazy=False)
+
+        for _, lbs, dev in act.stream_segments(5, 5):
+            self.assertIsNone(lbs)
+            self.assertIsNone(dev)
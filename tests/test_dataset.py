@@ -1,5 +1,9 @@
+import shutil
+import tempfile
 import unittest
 
+from pathlib import Path
+
 import pymudata
 
 
@@ -29,6 +33,28 @@ class TestActivity(unittest.TestCase):
 
         self.assertEqual(4, len(ds.all_activities()))
 
+    def test_synth_dataset_paths(self):
+        ds = pymudata.Dataset(self.base_dataset)
+        ds.synth()
+
+        names = sorted(x.file_path.name for x in ds.all_activities())
+
+        self.assertListEqual(['flexstand.13.fa.0.csv', 'flexstand.13.ok.0.csv',
+                              'hs.38.er.0.csv', 'hs.38.ok.0.csv'], names)
+
+    def test_synth_dataset_dot_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, 'hs').mkdir()
+            shutil.copy('./tests/activity.csv', Path(root, 'hs', '.h.csv'))
+            shutil.copy('./tests/activity.csv', Path(root, 'hs', 'h.csv'))
+
+            ds = pymudata.Dataset(root)
+            ds.synth()
+
+            names = sorted(x.file_path.name for x in ds.all_activities())
+
+            self.assertListEqual(['.h.csv', 'h.csv'], names)
+
     def test_mask_dataset(self):
         ds = pymudata.Dataset(self.base_dataset)
         ds.synth()
@@ -0,0 +1,122 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import pymudata
+
+
+class TestPreprocessing(unittest.TestCase):
+
+    base_activity = './tests/activity.csv'
+    base_dataset = './tests/test_ds'
+
+    def test_empty_pipeline(self):
+        act = pymudata.Activity(self.base_activity,
+                                pipeline=pymudata.Pipeline(), lazy=False)
+
+        self.assertTrue(np.array_equal(act.values, act.processed_values))
+        self.assertListEqual(act.columns, act.processed_columns)
+        self.assertFalse(np.shares_memory(act.values, act.processed_values))
+
+        act.processed_dataframe.iloc[0, 1] = 100.0
+
+        self.assertNotEqual(100.0, act.values[0, 1])
+
+    def test_low_pass(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+        values, columns = pymudata.LowPass(5)(act.values, act.columns)
+
+        self.assertTupleEqual(act.values.shape, values.shape)
+        self.assertTrue(np.array_equal(act.channel('timestamp'), values[:, 0]))
+        self.assertAlmostEqual(act.values[8:13, 1].mean(), values[10, 1])
+        self.assertAlmostEqual(act.values[:3, 1].mean(), values[0, 1])
+
+    def test_low_pass_nan(self):
+        values = np.arange(20, dtype=float).reshape(10, 2)
+        values[2, 1] = np.nan
+
+        out, _ = pymudata.LowPass(3)(values, ['timestamp', 'acc_x_k'])
+
+        self.assertListEqual([1, 2, 3],
+                             np.flatnonzero(np.isnan(out[:, 1])).tolist())
+        self.assertAlmostEqual(2.0, out[0, 1])
+        self.assertAlmostEqual(9.0, out[4, 1])
+        self.assertTrue(np.array_equal(values[:, 0], out[:, 0]))
+
+    def test_low_pass_invalid_window(self):
+        with self.assertRaises(Exception) as ex:
+            pymudata.LowPass(0)
+
+        self.assertIn('Invalid window size 0', str(ex.exception))
+
+    def test_remove_gravity(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+        values, _ = pymudata.RemoveGravity(len(act.values) * 2)(
+            act.values, act.columns)
+
+        acc = act.sensor('knee')['acc']
+
+        self.assertTrue(np.allclose(acc - acc.mean(axis=0), values[:, 1:4]))
+        self.assertTrue(np.array_equal(act.values[:, 4:], values[:, 4:]))
+
+    def test_magnitude(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+        values, columns = pymudata.Magnitude()(act.values, act.columns)
+
+        self.assertListEqual(act.columns + ['acc_mag_knee', 'gyro_mag_knee'],
+                             columns)
+        self.assertTrue(np.allclose(
+            np.linalg.norm(act.sensor('knee')['gyro'], axis=1),
+            values[:, -1]))
+
+    def test_pipeline_on_activity(self):
+        pipeline = pymudata.Pipeline([pymudata.LowPass(3),
+                                      pymudata.Magnitude()])
+        act = pymudata.Activity(self.base_activity, pipeline=pipeline)
+
+        self.assertIsNone(act.processed_values)
+
+        act.acquire()
+
+        self.assertTupleEqual((7972, 9), act.processed_values.shape)
+        self.assertTupleEqual((7972, 7), act.values.shape)
+
+        for win, _ in act.stream(10, 10):
+            self.assertEqual(9, win.shape[1])
+
+        self.assertIsNone(act._dataframe)
+
+    def test_pipeline_keeps_extra_columns(self):
+        act = pymudata.Activity('./tests/mixed.csv',
+                                pipeline=pymudata.Pipeline(), lazy=False)
+
+        for win, _ in act.stream(3, 1):
+            self.assertTrue(win.equals(act.dataframe))
+
+        act.pipeline = pymudata.Pipeline([pymudata.LowPass(3)])
+        df = act.processed_dataframe
+
+        self.assertListEqual(['timestamp', 'acc_x_k', 'count', 'label'],
+                             list(df.columns))
+        self.assertTrue(pd.api.types.is_integer_dtype(df['count']))
+        self.assertListEqual(['a', 'b', 'c'], list(df['label']))
+        self.assertAlmostEqual(0.6, df['acc_x_k'][0])
+
+    def test_pipeline_set_after_acquire(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+        act.pipeline = pymudata.Pipeline([pymudata.Magnitude()])
+
+        self.assertIn('acc_mag_knee', act.processed_columns)
+
+        act.pipeline = None
+
+        self.assertIsNone(act.processed_values)
+
+    def test_pipeline_on_dataset(self):
+        pipeline = pymudata.Pipeline([pymudata.Magnitude()])
+        ds = pymudata.Dataset(self.base_dataset, pipeline=pipeline)
+        ds.synth()
+
+        for act in ds.all_activities():
+            self.assertIs(pipeline, act.pipeline)
@@ -0,0 +1,153 @@
+import unittest
+
+import pymudata
+
+from pymudata.validation import validate_activity
+
+
+class TestValidation(unittest.TestCase):
+
+    base_activity = './tests/activity.csv'
+    base_dataset = './tests/test_ds'
+    columns = ['timestamp', 'acc_x_knee', 'acc_y_knee', 'acc_z_knee',
+               'gyro_x_knee', 'gyro_y_knee', 'gyro_z_knee']
+
+    def test_valid_activity(self):
+        act = pymudata.Activity(self.base_activity)
+        report = validate_activity(act, columns=self.columns)
+
+        self.assertTrue(report.valid)
+        self.assertEqual(7972, report.rows)
+        self.assertListEqual([], report.issues)
+        self.assertIsNone(act.values)
+
+    def test_header_only(self):
+        act = pymudata.Activity(self.base_activity)
+        report = validate_activity(act, columns=self.columns, full=False)
+
+        self.assertTrue(report.valid)
+        self.assertEqual(7972, report.rows)
+
+    def test_missing_columns(self):
+        act = pymudata.Activity(self.base_activity)
+        report = validate_activity(act, columns=['timestamp', 'acc_x_ankle'],
+                                   full=False)
+
+        self.assertFalse(report.valid)
+        self.assertListEqual(['Missing columns: acc_x_ankle'], report.issues)
+
+    def test_annotations_mismatch(self):
+        act = pymudata.Activity(self.base_activity,
+                                ground_coordinates=[10, 8000],
+                                pointwise_labels=[1] * 10)
+        report = validate_activity(act)
+
+        self.assertEqual(2, len(report.issues))
+        self.assertIn('Count mismatch between points and labels',
+                      report.issues[0])
+        self.assertIn('Ground coordinates out of range', report.issues[1])
+
+    def test_blank_lines(self):
+        act = pymudata.Activity('./tests/blank_lines.csv',
+                                ground_coordinates=[0, 2],
+                                pointwise_labels=[1, 1])
+
+        full = validate_activity(act)
+        fast = validate_activity(act, full=False)
+
+        self.assertEqual(2, full.rows)
+        self.assertEqual(full.rows, fast.rows)
+        self.assertTrue(full.valid)
+        self.assertTrue(fast.valid)
+
+    def test_quoted_header(self):
+        act = pymudata.Activity('./tests/quoted_header.csv')
+
+        for full in (True, False):
+            report = validate_activity(act, columns=['timestamp', 'acc_x_k'],
+                                       full=full)
+
+            self.assertTrue(report.valid)
+            self.assertEqual(2, report.rows)
+
+    def test_empty_file(self):
+        act = pymudata.Activity('./tests/empty.csv')
+
+        for full in (True, False):
+            report = validate_activity(act, full=full)
+
+            self.assertFalse(report.valid)
+            self.assertIn('Unable to parse file', report.issues[0])
+
+    def test_empty_labels(self):
+        act = pymudata.Activity(self.base_activity, pointwise_labels=[])
+
+        self.assertTrue(validate_activity(act).valid)
+        self.assertTrue(validate_activity(act, full=False).valid)
+
+    def test_mixed_types(self):
+        columns = ['timestamp', 'acc_x_k', 'count', 'label']
+
+        for act in (pymudata.Activity('./tests/mixed.csv'),
+                    pymudata.Activity('./tests/mixed.csv', lazy=False)):
+            report = validate_activity(act, columns=columns)
+
+            self.assertTrue(report.valid)
+            self.assertEqual(3, report.rows)
+
+    def test_acquired_activity(self):
+        act = pymudata.Activity(self.base_activity, lazy=False)
+        act.values[5, 0] = 0
+        act.values[6, 1] = float('nan')
+
+        report = validate_activity(act)
+
+        self.assertListEqual(['1 missing values in acc_x_knee',
+                              'Timestamps not monotonic at 1 points'],
+                             report.issues)
+
+    def test_validate_dataset(self):
+        ds = pymudata.Dataset(self.base_dataset)
+        ds.synth()
+
+        reports = ds.validate(workers=2, columns=['timestamp'])
+
+        self.assertEqual(4, len(reports))
+        self.assertListEqual([x.file_path for x in ds.all_activities()],
+                             [x.file_path for x in reports])
+
+        for r in reports:
+            self.assertTrue(r.valid)
+
+        rows = {r.file_path.name: r.rows for r in reports}
+
+        self.assertEqual(7742, rows['hs.38.ok.0.csv'])
+        self.assertEqual(rows, {r.file_path.name: r.rows
+                                for r in ds.validate(full=False)})
+
+    def test_validate_mixed_state_dataset(self):
+        step = lambda values, columns: (values, columns)  # noqa: E731
+        ds = pymudata.Dataset(self.base_dataset,
+                              pipeline=pymudata.Pipeline([step]))
+        ds.synth()
+
+        acts = ds.all_activities()
+        acts[1].acquire()
+        acts[2].pointwise_labels = [1] * 10
+
+        reports = ds.validate(workers=2)
+
+        self.assertListEqual([x.file_path for x in acts],
+                             [x.file_path for x in reports])
+        self.assertListEqual([True, True, False, True],
+                             [r.valid for r in reports])
+        self.assertIsNone(acts[0].values)
+
+    def test_validate_masked_dataset(self):
+        ds = pymudata.Dataset(self.base_dataset)
+        ds.synth()
+        ds.mask_for_exercise('hs')
+
+        reports = ds.validate(full=False)
+
+        self.assertListEqual(['hs', 'hs'], [r.exercise_name for r in reports])